@@ -10,6 +10,8 @@ from urllib.parse import urlencode, urlparse, urlunparse, parse_qsl
 import requests
 from bs4 import BeautifulSoup
 
+from extractors.utils_dates import parse_iso_date
+
 logger = logging.getLogger("trustpilot")
 
 @dataclass
@@ -277,14 +279,4 @@ class TrustpilotScraper:
 
     @staticmethod
     def parse_iso(date_str: Optional[str]) -> Optional[datetime]:
-        if not date_str:
-            return None
-        for fmt in ("%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d"):
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
-        try:
-            return datetime.fromisoformat(date_str)
-        except ValueError:
-            return None
\ No newline at end of file
+        return parse_iso_date(date_str)
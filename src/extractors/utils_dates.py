@@ -0,0 +1,55 @@
+import logging
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("dates")
+
+# Per-review timestamps carry milliseconds and are almost always unique, so
+# the cache mainly pays off for repeated filter bounds and duplicate
+# date-only experienceDate values.
+DATE_CACHE_SIZE = 8192
+
+# On Python 3.11+ fromisoformat accepts every Trustpilot timestamp format;
+# these only matter on older interpreters. Free-text <time> values such as
+# "Jun 14, 2024" fail every attempt and are cached as None.
+_FALLBACK_FORMATS = (
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d",
+)
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_iso_cached(value: str) -> Optional[datetime]:
+    text = value.strip()
+    if text[-1:] in ("Z", "z"):
+        text = text[:-1]
+
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        parsed = None
+        for fmt in _FALLBACK_FORMATS:
+            try:
+                parsed = datetime.strptime(text, fmt)
+                break
+            except ValueError:
+                continue
+
+    if parsed is None:
+        logger.debug("Unrecognized date format: %s", value)
+        return None
+
+    # Keep every timestamp naive UTC so values from different sources
+    # (with or without an offset) stay comparable.
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def parse_iso_date(value: Optional[str]) -> Optional[datetime]:
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_iso_cached(value)
+
+def review_timestamp(review: Dict[str, Any]) -> Optional[datetime]:
+    return parse_iso_date(review.get("experienceDate") or review.get("datePublished"))
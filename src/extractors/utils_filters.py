@@ -1,30 +1,9 @@
 import logging
-from datetime import datetime
 from typing import Any, Dict, Iterable, List, Optional
 
-logger = logging.getLogger("filters")
-
-def _parse_date(value: Optional[str]) -> Optional[datetime]:
-    if not value:
-        return None
-
-    tried_formats = [
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%d",
-    ]
+from extractors.utils_dates import parse_iso_date, review_timestamp
 
-    for fmt in tried_formats:
-        try:
-            return datetime.strptime(value, fmt)
-        except ValueError:
-            continue
-
-    try:
-        return datetime.fromisoformat(value)
-    except ValueError:
-        logger.debug("Unrecognized date format: %s", value)
-        return None
+logger = logging.getLogger("filters")
 
 def _contains_any(text: str, keywords: Iterable[str]) -> bool:
     text_lower = text.lower()
@@ -44,8 +23,8 @@ def apply_filters(
     include_keywords = filters.get("keywordsInclude") or []
     exclude_keywords = filters.get("keywordsExclude") or []
     verified_only = bool(filters.get("verifiedOnly", False))
-    date_from = _parse_date(filters.get("dateFrom"))
-    date_to = _parse_date(filters.get("dateTo"))
+    date_from = parse_iso_date(filters.get("dateFrom"))
+    date_to = parse_iso_date(filters.get("dateTo"))
 
     filtered: List[Dict[str, Any]] = []
 
@@ -94,8 +73,7 @@ def apply_filters(
                 continue
 
         if date_from or date_to:
-            raw_date = review.get("experienceDate") or review.get("datePublished")
-            parsed_date = _parse_date(raw_date)
+            parsed_date = review_timestamp(review)
             if parsed_date:
                 if date_from and parsed_date < date_from:
                     continue